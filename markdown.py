@@ -1,17 +1,25 @@
 """Minimal Markdown to HTML converter used by the blog generator.
 
-This is intentionally small to avoid external dependencies in CI, while still
+The generator renders with cmarkgfm (libcmark-gfm) when it is installed; this
+module is the dependency-free fallback. It is intentionally small while still
 supporting the basics used in GitHub Issues: headings, bullet lists, fenced code
-blocks, paragraphs, and inline links.
+blocks, tables, paragraphs, and inline links.
 """
 from __future__ import annotations
 
-import html
 import re
+from functools import lru_cache
 from typing import List, Optional
 
 
 LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+LINE_CLASSIFIER = re.compile(r"(?P<fence>```)|(?P<heading>#+)|(?P<bullet>[-*])(?: |$)")
+TABLE_SEPARATOR_CELL = re.compile(r"\s*:?-{3,}:?\s*")
+
+# Same replacements as html.escape(quote=True), applied in a single pass.
+_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
 
 MATH_SYMBOLS = {
     r"\\wedge": "∧",
@@ -27,12 +35,17 @@ MATH_SYMBOLS = {
 
 
 def _escape_with_math(text: str) -> str:
+    if "\\" not in text:
+        return text.translate(_ESCAPE_TABLE)
     for pattern, symbol in MATH_SYMBOLS.items():
         text = re.sub(pattern, symbol, text)
-    return html.escape(text)
+    return text.translate(_ESCAPE_TABLE)
 
 
+@lru_cache(maxsize=4096)
 def _render_inline(text: str) -> str:
+    if "[" not in text:
+        return _escape_with_math(text)
     segments: List[str] = []
     last = 0
     for match in LINK_PATTERN.finditer(text):
@@ -42,7 +55,7 @@ def _render_inline(text: str) -> str:
         label, url = match.groups()
         safe_label = _escape_with_math(label)
         segments.append(
-            f"<a href=\"{html.escape(url)}\" target=\"_blank\">{safe_label}</a>"
+            f"<a href=\"{url.translate(_ESCAPE_TABLE)}\" target=\"_blank\">{safe_label}</a>"
         )
         last = end
     if last < len(text):
@@ -63,55 +76,65 @@ def _is_table_separator(line: str) -> bool:
     if "|" not in line:
         return False
     parts = line.strip().strip("|").split("|")
-    return all(re.fullmatch(r"\s*:?-{3,}:?\s*", part) for part in parts)
+    return all(TABLE_SEPARATOR_CELL.fullmatch(part) for part in parts)
 
 
 def _render_table(headers: List[str], rows: List[List[str]]) -> str:
-    header_html = "".join(f"<th>{_render_inline(cell)}</th>" for cell in headers)
-    body_html = "".join(
-        f"<tr>{''.join(f'<td>{_render_inline(cell)}</td>' for cell in row)}</tr>"
-        for row in rows
-    )
-    return f"<table><thead><tr>{header_html}</tr></thead><tbody>{body_html}</tbody></table>"
+    out: List[str] = ["<table><thead><tr>"]
+    for cell in headers:
+        out += ("<th>", _render_inline(cell), "</th>")
+    out.append("</tr></thead><tbody>")
+    for row in rows:
+        out.append("<tr>")
+        for cell in row:
+            out += ("<td>", _render_inline(cell), "</td>")
+        out.append("</tr>")
+    out.append("</tbody></table>")
+    return "".join(out)
 
 
 def markdown(text: str, extensions=None) -> str:  # noqa: D401
     """Convert a small subset of Markdown into HTML."""
     lines = text.splitlines()
+    # Fragments are collected in a list and joined once at the end; in CPython
+    # this is cheaper than encoding each piece into a bytearray buffer.
     html_parts: List[str] = []
+    emit = html_parts.append
     in_code = False
     in_list = False
     paragraph: List[str] = []
 
     def flush_paragraph() -> None:
         if paragraph:
-            html_parts.append(f"<p>{'<br/>'.join(paragraph)}</p>")
+            emit(f"<p>{'<br/>'.join(paragraph)}</p>")
             paragraph.clear()
 
     def close_list() -> None:
         nonlocal in_list
         if in_list:
-            html_parts.append("</ul>")
+            emit("</ul>")
             in_list = False
 
     i = 0
     while i < len(lines):
         line = lines[i]
         stripped = line.strip()
-        if stripped.startswith("```"):
+        match = LINE_CLASSIFIER.match(stripped)
+        kind = match.lastgroup if match else None
+        if kind == "fence":
             flush_paragraph()
             close_list()
             if in_code:
-                html_parts.append("</code></pre>")
+                emit("</code></pre>")
                 in_code = False
             else:
-                html_parts.append("<pre><code>")
+                emit("<pre><code>")
                 in_code = True
             i += 1
             continue
 
         if in_code:
-            html_parts.append(html.escape(line))
+            emit(line.translate(_ESCAPE_TABLE))
             i += 1
             continue
 
@@ -121,7 +144,7 @@ def markdown(text: str, extensions=None) -> str:  # noqa: D401
             i += 1
             continue
 
-        if i + 1 < len(lines):
+        if "|" in stripped and i + 1 < len(lines):
             header_cells = _parse_table_row(stripped)
             if header_cells and _is_table_separator(lines[i + 1].strip()):
                 flush_paragraph()
@@ -134,24 +157,24 @@ def markdown(text: str, extensions=None) -> str:  # noqa: D401
                         break
                     rows.append(row)
                     i += 1
-                html_parts.append(_render_table(header_cells, rows))
+                emit(_render_table(header_cells, rows))
                 continue
 
-        if stripped.startswith("#"):
+        if kind == "heading":
             flush_paragraph()
             close_list()
-            level = len(stripped) - len(stripped.lstrip("#"))
+            level = match.end()
             content = stripped[level:].strip()
-            html_parts.append(f"<h{level}>{_render_inline(content)}</h{level}>")
+            emit(f"<h{level}>{_render_inline(content)}</h{level}>")
             i += 1
             continue
 
-        if stripped[0] in "-*" and (len(stripped) == 1 or stripped[1] == " "):
+        if kind == "bullet":
             flush_paragraph()
             if not in_list:
-                html_parts.append("<ul>")
+                emit("<ul>")
                 in_list = True
-            html_parts.append(f"<li>{_render_inline(stripped[1:].strip())}</li>")
+            emit(f"<li>{_render_inline(stripped[1:].strip())}</li>")
             i += 1
             continue
 
@@ -162,6 +185,6 @@ def markdown(text: str, extensions=None) -> str:  # noqa: D401
     flush_paragraph()
     close_list()
     if in_code:
-        html_parts.append("</code></pre>")
+        emit("</code></pre>")
 
     return "\n".join(html_parts)
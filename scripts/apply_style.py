@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
 import re
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # fall back to the standard library parser
+    json_loads = json.loads
+
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config" / "author.json"
 STYLES_DIR = ROOT / "styles"
 TARGET_STYLE = ROOT / "style.css"
+STYLE_VERSION_FILE = ROOT / ".styleversion"
+STYLE_HREF_PATTERN = re.compile(r'href="(?P<prefix>\.\./)?style\.css(?:\?v=[^"]*)?"')
 
 
 def load_style_name() -> str:
@@ -18,8 +26,8 @@ def load_style_name() -> str:
         return default_style
 
     try:
-        with CONFIG_PATH.open(encoding="utf-8") as handle:
-            data = json.load(handle)
+        with CONFIG_PATH.open("rb") as handle:
+            data = json_loads(handle.read())
     except json.JSONDecodeError:
         return default_style
 
@@ -43,6 +51,38 @@ def resolve_style_file(style_name: str) -> Path:
     return STYLES_DIR / "default.css"
 
 
+def load_applied_version() -> str | None:
+    """Return the style version whose links were last written into the HTML files."""
+    if not STYLE_VERSION_FILE.exists():
+        return None
+    return STYLE_VERSION_FILE.read_text(encoding="utf-8").strip() or None
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path only when the bytes differ from what is on disk."""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _read_if_references_style(path: Path) -> str | None:
+    """Return the file's text if it mentions style.css, without decoding files that don't."""
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return None
+        with mapped:
+            if mapped.find(b"style.css") < 0:
+                return None
+            return mapped[:].decode("utf-8")
+
+
 def update_stylesheet_links(version: str) -> list[Path]:
     """Inject a cache-busting query string into all HTML stylesheet links."""
 
@@ -51,15 +91,16 @@ def update_stylesheet_links(version: str) -> list[Path]:
     if posts_dir.exists():
         html_files.extend(sorted(posts_dir.glob("*.html")))
 
-    pattern = re.compile(r'href="(?P<prefix>\.\./)?style\.css(?:\?v=[^"]*)?"')
     replacement = r'href="\g<prefix>style.css?v=' + version + '"'
 
     updated: list[Path] = []
     for html_file in html_files:
         if not html_file.exists():
             continue
-        original = html_file.read_text(encoding="utf-8")
-        rewritten = pattern.sub(replacement, original)
+        original = _read_if_references_style(html_file)
+        if original is None:
+            continue
+        rewritten = STYLE_HREF_PATTERN.sub(replacement, original)
         if rewritten != original:
             html_file.write_text(rewritten, encoding="utf-8")
             updated.append(html_file)
@@ -71,12 +112,17 @@ def apply_style() -> None:
     style_name = load_style_name()
     source = resolve_style_file(style_name)
     css_content = source.read_text(encoding="utf-8")
-    TARGET_STYLE.write_text(css_content, encoding="utf-8")
+    _write_if_changed(TARGET_STYLE, css_content)
 
     version = compute_style_version(css_content)
+    print(f"Applied style: {source.name} -> {TARGET_STYLE.name} (version {version})")
+    if load_applied_version() == version:
+        print("Style version unchanged; skipped stylesheet reference updates.")
+        return
+
     updated_files = update_stylesheet_links(version)
+    _write_if_changed(STYLE_VERSION_FILE, version + "\n")
 
-    print(f"Applied style: {source.name} -> {TARGET_STYLE.name} (version {version})")
     if updated_files:
         updated_paths = ", ".join(str(path.relative_to(ROOT)) for path in updated_files)
         print(f"Updated stylesheet references in: {updated_paths}")
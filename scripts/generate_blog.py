@@ -1,24 +1,154 @@
 from __future__ import annotations
 
 import datetime as dt
+import gzip
+import http.client
 import json
 import os
 import re
 import sys
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from importlib import metadata
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable, List, Mapping, MutableMapping
 
-from urllib import parse, request
-import markdown  # 需要 pip install markdown
+from urllib import parse
 import hashlib
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+try:
+    from cmarkgfm import github_flavored_markdown_to_html
+    from cmarkgfm.cmark import Options
+except ImportError:  # 未安装 cmarkgfm 时回退到仓库自带的纯 Python 实现
+    from markdown import markdown as render_markdown
+
+    RENDERER = "markdown.py"
+else:
+    RENDERER = f"cmarkgfm {metadata.version('cmarkgfm')}"
+
+    def render_markdown(text: str) -> str:
+        """使用 libcmark-gfm 渲染 Markdown（含表格扩展），保留正文中的原始 HTML"""
+        return github_flavored_markdown_to_html(text, options=Options.CMARK_OPT_UNSAFE)
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时回退到标准库 json
+    json_loads = json.loads
+
+    def dump_json(data: object) -> str:
+        """序列化为带缩进、键有序的 JSON 文本"""
+        return json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+else:
+    json_loads = orjson.loads
+
+    def dump_json(data: object) -> str:
+        """序列化为带缩进、键有序的 JSON 文本"""
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, option=option).decode("utf-8")
+
 CONFIG_PATH = ROOT / "config" / "author.json"
 POST_DIR = ROOT / "_posts"
 INDEX_FILE = ROOT / "index.html"
 LIST_FILE = ROOT / "list.html"
+RENDER_CACHE_FILE = POST_DIR / ".cache.json"
+# 文章 HTML 的格式（页面模板、标题锚点、markdown.py 输出等）改变时递增，使已缓存的文章全部重新渲染
+RENDER_CACHE_VERSION = "1"
+API_HOST = "api.github.com"
+
+# 每个线程复用一条到 GitHub API 的 keep-alive 连接，分页请求无需重复 TLS 握手
+_api_connections = threading.local()
+_open_connections: List[http.client.HTTPSConnection] = []
+_open_connections_lock = threading.Lock()
+# 仓库改名或转移后 GitHub 返回重定向，跟随一次且只限 API 主机
+_REDIRECT_STATUSES = {301, 302, 307, 308}
+
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9\u4e00-\u9fff]+")
+
+# 标题锚点，规则与 Python-Markdown 的 toc 扩展一致，保证已发布文章中的页内链接不失效
+_HEADING_RE = re.compile(r"<h([1-6])>(.*?)</h\1>", re.S)
+_TAG_RE = re.compile(r"<[^>]*>")
+_HEADING_ID_COUNT_RE = re.compile(r"^(.*)_([0-9]+)$")
+
+# 页面模板按动态字段切分为常量片段，渲染时与字段交错拼接，避免每次构造大段 f-string
+_POST_TEMPLATE_PARTS = (
+    """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <title>""",
+    """ | 轻松博客</title>
+  <link rel="stylesheet" href="../style.css?v=""",
+    """" />
+</head>
+<body>
+  <header class="top-nav">
+    <a href="../index.html" class="brand">轻松博客</a>
+    <a class="ghost-btn" href="../list.html">返回列表</a>
+  </header>
+  <main class="page">
+    <article class="card article">
+      <p class="eyebrow">发布于 """,
+    """</p>
+      <h1>""",
+    """</h1>
+      <div class="article-body">""",
+    """</div>
+    </article>
+  </main>
+</body>
+</html>""",
+)
+
+_CARD_TEMPLATE_PARTS = (
+    """
+        <a class="card post-card" href="_posts/""",
+    """.html">
+          <p class="eyebrow">""",
+    """</p>
+          <h2>""",
+    """</h2>
+          <p class="muted">""",
+    """</p>
+        </a>""",
+)
+
+_EMPTY_LIST_HTML = '<p class="muted">还没有文章，快去创建一个带 blog-post 标签的 Issue 吧。</p>'
+
+_LIST_TEMPLATE_PARTS = (
+    """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <title>文章列表 | 轻松博客</title>
+  <link rel="stylesheet" href="style.css?v=""",
+    """" />
+</head>
+<body>
+  <header class="top-nav">
+    <a href="index.html" class="brand">轻松博客</a>
+    <a class="ghost-btn" href=\"""",
+    """/issues">提交文章 Issue</a>
+  </header>
+  <main class="page">
+    <section class="section-heading">
+      <p class="eyebrow">所有文章</p>
+      <h1>Issue 驱动的创作</h1>
+      <p class="muted">带有 blog-post 标签的 Issue 会自动出现在这里。</p>
+    </section>
+    <div class="grid">""",
+    """</div>
+  </main>
+</body>
+</html>""",
+)
 
 
 def load_author_config() -> Mapping[str, str]:
@@ -34,8 +164,8 @@ def load_author_config() -> Mapping[str, str]:
     if not CONFIG_PATH.exists():
         return default
 
-    with CONFIG_PATH.open(encoding="utf-8") as handle:
-        data = json.load(handle)
+    with CONFIG_PATH.open("rb") as handle:
+        data = json_loads(handle.read())
 
     return {**default, **{k: v for k, v in data.items() if isinstance(v, str)}}
 
@@ -53,7 +183,7 @@ def style_version() -> str:
 
 def slugify(title: str) -> str:
     """生成文章的 slug"""
-    slug = re.sub(r"[^a-zA-Z0-9\u4e00-\u9fff]+", "-", title).strip("-").lower()
+    slug = _SLUG_RE.sub("-", title).strip("-").lower()
     return slug or "post"
 
 
@@ -65,18 +195,102 @@ def repository_url() -> str:
 
 def summarize_body(body: str, length: int = 140) -> str:
     """从 Issue 内容中提取摘要"""
-    condensed = re.sub(r"\s+", " ", body).strip()
+    condensed = " ".join(body.split())
     if len(condensed) <= length:
         return condensed
     return condensed[: length - 1].rstrip() + "…"
 
 
+def _api_connection() -> http.client.HTTPSConnection:
+    """返回当前线程的 GitHub API 连接"""
+    conn = getattr(_api_connections, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+        _api_connections.conn = conn
+        with _open_connections_lock:
+            _open_connections.append(conn)
+    return conn
+
+
+def _close_api_connections() -> None:
+    """关闭所有线程打开的 GitHub API 连接"""
+    with _open_connections_lock:
+        for conn in _open_connections:
+            conn.close()
+        _open_connections.clear()
+    _api_connections.__dict__.clear()
+
+
+def _request_path(url: str) -> str:
+    """从完整 URL 中取出请求路径与查询串"""
+    parts = parse.urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def _fetch_page(url: str, headers: Mapping[str, str]) -> tuple[bytes, str] | None:
+    """请求一页 Issue，返回响应内容与 Link 头；失败时返回 None"""
+    path = _request_path(url)
+    conn = _api_connection()
+
+    # 增加简单的错误处理，防止 API 请求失败导致崩溃
+    try:
+        conn.request("GET", path, headers=dict(headers))
+        resp = conn.getresponse()
+        payload = resp.read()
+        if resp.status in _REDIRECT_STATUSES:
+            location = parse.urljoin(f"https://{API_HOST}{path}", resp.getheader("Location", ""))
+            if parse.urlsplit(location).netloc == API_HOST:
+                conn.request("GET", _request_path(location), headers=dict(headers))
+                resp = conn.getresponse()
+                payload = resp.read()
+        if resp.status != 200:
+            raise http.client.HTTPException(f"HTTP Error {resp.status}: {resp.reason}")
+        if resp.getheader("Content-Encoding") == "gzip":
+            payload = gzip.decompress(payload)
+        return payload, resp.getheader("Link", "")
+    except Exception as e:
+        # 出错后关闭连接，下次请求会重新建立
+        conn.close()
+        print(f"Error fetching issues: {e}")
+        return None
+
+
+def _parse_link_header(link_header: str) -> dict[str, str]:
+    """解析分页 Link 头，返回 rel -> URL"""
+    links: dict[str, str] = {}
+    for link in link_header.split(","):
+        segments = link.split(";")
+        if len(segments) < 2:
+            continue
+        candidate = segments[0].strip()
+        if not (candidate.startswith("<") and candidate.endswith(">")):
+            continue
+        for segment in segments[1:]:
+            name, _, value = segment.strip().partition("=")
+            if name == "rel":
+                links[value.strip('"')] = candidate[1:-1]
+    return links
+
+
+def _page_number(url: str | None) -> int:
+    """从分页 URL 中读取 page 参数"""
+    if not url:
+        return 1
+    page = parse.parse_qs(parse.urlsplit(url).query).get("page", ["1"])[0]
+    return int(page) if page.isdigit() else 1
+
+
 def fetch_issues(
     token: str, repository: str, label: str | None = None, allowed_author: str | None = None
 ) -> List[MutableMapping[str, str]]:
     """Fetch issues from GitHub API"""
-    url = f"https://api.github.com/repos/{repository}/issues"
-    headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github+json"}
+    url = f"https://{API_HOST}/repos/{repository}/issues"
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "Easy-blogging",
+        "Accept-Encoding": "gzip",
+    }
     params = {
         "state": "open",
         "per_page": 100,
@@ -85,42 +299,78 @@ def fetch_issues(
     }
     if label:
         params["labels"] = label
+    if allowed_author:
+        # 由 GitHub 按作者过滤，避免下载并解析其他人的 Issue
+        params["creator"] = allowed_author
+
+    try:
+        payloads = _fetch_payloads(url, params, headers)
+    finally:
+        _close_api_connections()
 
     issues: List[MutableMapping[str, str]] = []
+    for payload in payloads:
+        issues.extend(item for item in json_loads(payload) if "pull_request" not in item)
 
-    while url:
-        query = f"?{parse.urlencode(params)}" if params else ""
-        req = request.Request(url + query, headers=headers)
-        
-        # 增加简单的错误处理，防止 API 请求失败导致崩溃
-        try:
-            with request.urlopen(req) as resp:
-                payload = resp.read()
-                link_header = resp.headers.get("Link", "")
-        except Exception as e:
-            print(f"Error fetching issues: {e}")
-            break
-
-        page_items = [item for item in json.loads(payload) if "pull_request" not in item]
-        for issue in page_items:
-            # 安全检查：防止 user 字段为空的情况（极少见但可能）
-            if issue.get("user") and issue["user"].get("login") != allowed_author:
-                continue
-            issues.append(issue)
-
-        url = None
-        for link in link_header.split(","):
-            segments = link.split(";")
-            if len(segments) < 2:
-                continue
-            if 'rel="next"' in segments[1]:
-                candidate = segments[0].strip()
-                if candidate.startswith("<") and candidate.endswith(">"):
-                    url = candidate[1:-1]
+    return issues
+
+
+def _fetch_payloads(url: str, params: Mapping[str, object], headers: Mapping[str, str]) -> List[bytes]:
+    """按页请求 Issue 列表，返回各页原始响应内容（按页码顺序）"""
+    first = _fetch_page(f"{url}?{parse.urlencode(params)}", headers)
+    if first is None:
+        return []
+    payload, link_header = first
+    payloads = [payload]
+    links = _parse_link_header(link_header)
+
+    # 第一页的 rel="last" 给出总页数，其余页并发请求；结果按页码顺序拼接
+    last_page = _page_number(links.get("last"))
+    if last_page > 1:
+        page_urls = [
+            f"{url}?{parse.urlencode({**params, 'page': page})}" for page in range(2, last_page + 1)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for result in executor.map(lambda page_url: _fetch_page(page_url, headers), page_urls):
+                if result is None:
+                    break
+                payloads.append(result[0])
+    else:
+        next_url = links.get("next")
+        while next_url:
+            result = _fetch_page(next_url, headers)
+            if result is None:
                 break
-        params = None
+            payloads.append(result[0])
+            next_url = _parse_link_header(result[1]).get("next")
+
+    return payloads
+
+
+def _heading_id(text: str) -> str:
+    """按 Python-Markdown toc 扩展的默认规则把标题文本转换为 id"""
+    value = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    value = re.sub(r"[^\w\s-]", "", value).strip().lower()
+    return re.sub(r"[-\s]+", "-", value)
 
-    return issues
+
+def add_heading_ids(body_html: str) -> str:
+    """为正文中的标题补充 id 锚点，重复或为空的 id 追加 _1、_2 等后缀"""
+    used: set[str] = set()
+
+    def _replace(match: re.Match[str]) -> str:
+        level, content = match.groups()
+        ident = _heading_id(unescape(_TAG_RE.sub("", content)))
+        while ident in used or not ident:
+            count = _HEADING_ID_COUNT_RE.match(ident)
+            if count:
+                ident = f"{count.group(1)}_{int(count.group(2)) + 1}"
+            else:
+                ident = f"{ident}_1"
+        used.add(ident)
+        return f'<h{level} id="{ident}">{content}</h{level}>'
+
+    return _HEADING_RE.sub(_replace, body_html)
 
 
 def render_post(issue: Mapping[str, str], css_version: str) -> str:
@@ -130,30 +380,19 @@ def render_post(issue: Mapping[str, str], css_version: str) -> str:
     created_at_str = issue["created_at"].replace("Z", "+00:00")
     created_at = dt.datetime.fromisoformat(created_at_str)
     
-    body_html = markdown.markdown(issue.get("body", "") or "", extensions=["fenced_code", "tables", "toc"])
-    
-    return f"""<!DOCTYPE html>
-<html lang=\"zh-CN\">
-<head>
-  <meta charset=\"UTF-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
-  <title>{title} | 轻松博客</title>
-  <link rel=\"stylesheet\" href=\"../style.css?v={css_version}\" />
-</head>
-<body>
-  <header class=\"top-nav\">
-    <a href=\"../index.html\" class=\"brand\">轻松博客</a>
-    <a class=\"ghost-btn\" href=\"../list.html\">返回列表</a>
-  </header>
-  <main class=\"page\">
-    <article class=\"card article\">
-      <p class=\"eyebrow\">发布于 {created_at.strftime('%Y-%m-%d')}</p>
-      <h1>{title}</h1>
-      <div class=\"article-body\">{body_html}</div>
-    </article>
-  </main>
-</body>
-</html>"""
+    body_html = add_heading_ids(render_markdown(issue.get("body", "") or ""))
+
+    parts = _POST_TEMPLATE_PARTS
+    return "".join(
+        (
+            parts[0], title,
+            parts[1], css_version,
+            parts[2], created_at.strftime("%Y-%m-%d"),
+            parts[3], title,
+            parts[4], body_html,
+            parts[5],
+        )
+    )
 
 
 def remove_stale_posts(valid_slugs: set[str]) -> None:
@@ -166,67 +405,119 @@ def remove_stale_posts(valid_slugs: set[str]) -> None:
             post_file.unlink()
 
 
-def write_post_files(issues: Iterable[Mapping[str, str]], css_version: str) -> List[Mapping[str, str]]:
-    """将每个 Issue 渲染成 HTML 文件并保存"""
+def _write_if_changed(path: Path, text: str) -> bool:
+    """仅在内容变化时写入文件，避免无意义地改动未变化的页面"""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def load_render_cache() -> MutableMapping[str, Mapping[str, str]]:
+    """加载文章渲染缓存：slug -> {输入哈希, 输出文件哈希}"""
+    if not RENDER_CACHE_FILE.exists():
+        return {}
+
+    try:
+        with RENDER_CACHE_FILE.open("rb") as handle:
+            data = json_loads(handle.read())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def save_render_cache(cache: Mapping[str, Mapping[str, str]]) -> None:
+    """保存文章渲染缓存"""
+    POST_DIR.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(RENDER_CACHE_FILE, dump_json(cache))
+
+
+def render_cache_key(issue: Mapping[str, str], css_version: str) -> str:
+    """计算决定文章 HTML 内容的输入哈希"""
+    fields = (
+        RENDER_CACHE_VERSION,
+        RENDERER,
+        issue["title"],
+        issue.get("body", "") or "",
+        issue["created_at"],
+        css_version,
+    )
+    return hashlib.sha1("\0".join(fields).encode("utf-8")).hexdigest()
+
+
+def _is_cached(path: Path, key: str, entry: Mapping[str, str] | None) -> bool:
+    """输入未变且文件未被外部修改时可跳过渲染"""
+    if not entry or entry.get("key") != key or not path.exists():
+        return False
+    return hashlib.sha1(path.read_bytes()).hexdigest() == entry.get("html")
+
+
+def write_post_files(
+    issues: Iterable[Mapping[str, str]],
+    css_version: str,
+    render_cache: MutableMapping[str, Mapping[str, str]] | None = None,
+) -> List[Mapping[str, str]]:
+    """将每个 Issue 渲染成 HTML 文件并保存，输入未变化的文章直接复用已有文件"""
     POST_DIR.mkdir(parents=True, exist_ok=True)
-    metadata: List[Mapping[str, str]] = []
+    if render_cache is None:
+        render_cache = {}
 
-    for issue in issues:
-        title = issue["title"]
-        slug = slugify(title)
-        html = render_post(issue, css_version)
-        path = POST_DIR / f"{slug}.html"
-        path.write_text(html, encoding="utf-8")
-        metadata.append(
-            {
-                "title": title,
-                "slug": slug,
-                "summary": summarize_body(issue.get("body", "") or ""),
-                "created_at": issue["created_at"],
-            }
-        )
+    issues = list(issues)
+    slugs = [slugify(issue["title"]) for issue in issues]
+    # 不同标题可能得到相同的 slug；与逐篇写入时一样，只保留输入顺序中最后一篇，
+    # 这样每个文件只由一个线程写入
+    latest = dict(zip(slugs, issues))
 
-    return metadata
+    def _render_and_write(slug: str, issue: Mapping[str, str]) -> None:
+        path = POST_DIR / f"{slug}.html"
+        key = render_cache_key(issue, css_version)
+        if not _is_cached(path, key, render_cache.get(slug)):
+            html = render_post(issue, css_version)
+            _write_if_changed(path, html)
+            render_cache[slug] = {"key": key, "html": hashlib.sha1(html.encode("utf-8")).hexdigest()}
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_render_and_write, latest.keys(), latest.values()))
+
+    return [
+        {
+            "title": issue["title"],
+            "slug": slug,
+            "summary": summarize_body(issue.get("body", "") or ""),
+            "created_at": issue["created_at"],
+        }
+        for slug, issue in zip(slugs, issues)
+    ]
 
 
 def render_list(posts: List[Mapping[str, str]], css_version: str) -> str:
     """渲染文章列表页面"""
-    sorted_posts = sorted(posts, key=lambda post: post["created_at"], reverse=True)
-    cards = []
-    for post in sorted_posts:
-        cards.append(
-            f"""
-        <a class=\"card post-card\" href=\"_posts/{post['slug']}.html\">
-          <p class=\"eyebrow\">{post['created_at'][:10]}</p>
-          <h2>{post['title']}</h2>
-          <p class=\"muted\">{post['summary']}</p>
-        </a>"""
+    # fetch_issues 已按创建时间倒序返回，这里的排序只是防御性的：对已有序的输入只需一次线性扫描
+    sorted_posts = sorted(posts, key=itemgetter("created_at"), reverse=True)
+    page = _LIST_TEMPLATE_PARTS
+    card = _CARD_TEMPLATE_PARTS
+    parts = [page[0], css_version, page[1], repository_url(), page[2]]
+    for index, post in enumerate(sorted_posts):
+        if index:
+            parts.append("\n")
+        parts.extend(
+            (
+                card[0], post["slug"],
+                card[1], post["created_at"][:10],
+                card[2], post["title"],
+                card[3], post["summary"],
+                card[4],
+            )
         )
-
-    content = "\n".join(cards) or "<p class=\"muted\">还没有文章，快去创建一个带 blog-post 标签的 Issue 吧。</p>"
-    return f"""<!DOCTYPE html>
-<html lang=\"zh-CN\">
-<head>
-  <meta charset=\"UTF-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
-  <title>文章列表 | 轻松博客</title>
-  <link rel=\"stylesheet\" href=\"style.css?v={css_version}\" />
-</head>
-<body>
-  <header class=\"top-nav\">
-    <a href=\"index.html\" class=\"brand\">轻松博客</a>
-    <a class=\"ghost-btn\" href=\"{repository_url()}/issues\">提交文章 Issue</a>
-  </header>
-  <main class=\"page\">
-    <section class=\"section-heading\">
-      <p class=\"eyebrow\">所有文章</p>
-      <h1>Issue 驱动的创作</h1>
-      <p class=\"muted\">带有 blog-post 标签的 Issue 会自动出现在这里。</p>
-    </section>
-    <div class=\"grid\">{content}</div>
-  </main>
-</body>
-</html>"""
+    if not sorted_posts:
+        parts.append(_EMPTY_LIST_HTML)
+    parts.append(page[3])
+    return "".join(parts)
 
 
 def render_index(author: Mapping[str, str], css_version: str) -> str:
@@ -261,8 +552,8 @@ def render_index(author: Mapping[str, str], css_version: str) -> str:
 
 def write_site_files(posts: List[Mapping[str, str]], author: Mapping[str, str], css_version: str) -> None:
     """生成并保存所有静态网页文件"""
-    LIST_FILE.write_text(render_list(posts, css_version), encoding="utf-8")
-    INDEX_FILE.write_text(render_index(author, css_version), encoding="utf-8")
+    _write_if_changed(LIST_FILE, render_list(posts, css_version))
+    _write_if_changed(INDEX_FILE, render_index(author, css_version))
 
 
 def generate() -> None:
@@ -287,8 +578,11 @@ def generate() -> None:
     print(f"Found {len(issues)} issues.")
     
     css_version = style_version()
-    post_metadata = write_post_files(issues, css_version)
-    remove_stale_posts({post["slug"] for post in post_metadata})
+    render_cache = load_render_cache()
+    post_metadata = write_post_files(issues, css_version, render_cache)
+    valid_slugs = {post["slug"] for post in post_metadata}
+    remove_stale_posts(valid_slugs)
+    save_render_cache({slug: entry for slug, entry in render_cache.items() if slug in valid_slugs})
     author = load_author_config()
     write_site_files(post_metadata, author, css_version)
     print("Blog generated successfully.")